@@ -2,15 +2,23 @@
 MCPM Client package
 
 Provides client-specific implementations and configuration
+
+Symbols are loaded lazily (PEP 562) so that importing this package does not
+import every client manager module up front.
 """
 
-from mcpm.clients.base import BaseClientManager
-from mcpm.clients.client_config import ClientConfigManager
-from mcpm.clients.client_registry import ClientRegistry
-from mcpm.clients.managers.claude_desktop import ClaudeDesktopManager
-from mcpm.clients.managers.cursor import CursorManager
-from mcpm.clients.managers.trae import TraeManager
-from mcpm.clients.managers.windsurf import WindsurfManager
+import importlib
+
+# Mapping of exported names to the modules that define them
+_LAZY_IMPORTS = {
+    "BaseClientManager": "mcpm.clients.base",
+    "ClientConfigManager": "mcpm.clients.client_config",
+    "ClientRegistry": "mcpm.clients.client_registry",
+    "ClaudeDesktopManager": "mcpm.clients.managers.claude_desktop",
+    "CursorManager": "mcpm.clients.managers.cursor",
+    "TraeManager": "mcpm.clients.managers.trae",
+    "WindsurfManager": "mcpm.clients.managers.windsurf",
+}
 
 __all__ = [
     "BaseClientManager",
@@ -21,3 +29,19 @@ __all__ = [
     "ClientConfigManager",
     "ClientRegistry",
 ]
+
+
+def __getattr__(name: str):
+    """Lazily import an exported symbol on first attribute access"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name)
+    symbol = getattr(module, name)
+    # Cache on the package so subsequent lookups skip __getattr__
+    globals()[name] = symbol
+    return symbol
+
+
+def __dir__():
+    return sorted(set(__all__) | set(globals()))
@@ -375,16 +375,15 @@ class JSONClientManager(BaseClientManager):
         Returns:
             bool: Success or failure
         """
-        servers = self.get_servers()
+        # Load the config once and check membership directly
+        config = self._load_config()
+        servers = config[self.configure_key_name]
 
-        # Check if the server exists
         if server_name not in servers:
             logger.warning(f"Server {server_name} not found in {self.display_name} config")
             return False
 
-        # Load full config and remove the server
-        config = self._load_config()
-        del config[self.configure_key_name][server_name]
+        del servers[server_name]
 
         return self._save_config(config)
 
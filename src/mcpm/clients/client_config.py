@@ -23,6 +23,15 @@ class ClientConfigManager:
         """Refresh the local config cache from the config manager"""
         self._config = self.config_manager.get_config()
 
+    def _get_stashed_servers(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Get the stashed_servers section of the config, or None if absent
+
+        Refreshes the config cache and traverses it once, so callers avoid
+        repeated lookups and throwaway empty-dict allocations.
+        """
+        self._refresh_config()
+        return self._config.get("stashed_servers")
+
     def get_active_client(self) -> str | None:
         """Get the name of the currently active client or None if not set"""
         self._refresh_config()
@@ -43,20 +52,19 @@ class ClientConfigManager:
             self._refresh_config()
             return result
 
-        # Get supported clients
+        # Check against the supported client set
         from mcpm.clients.client_registry import ClientRegistry
 
-        supported_clients = ClientRegistry.get_supported_clients()
-
-        if client_name not in supported_clients:
+        if not ClientRegistry.is_client_supported(client_name):
             logger.error(f"Unknown client: {client_name}")
             return False
 
-        # Set the active client
-        result = self.config_manager.set_config("active_client", client_name)
-        # refresh the active profile
-        client = ClientRegistry.get_client_manager(client_name)
-        self.set_active_profile(client.get_associated_profile())  # type: ignore
+        # Set the active client and its associated profile in a single write
+        with self.config_manager.batch():
+            result = self.config_manager.set_config("active_client", client_name)
+            # refresh the active profile
+            client = ClientRegistry.get_client_manager(client_name)
+            self.set_active_profile(client.get_associated_profile())  # type: ignore
         self._refresh_config()
         return result
 
@@ -123,17 +131,6 @@ class ClientConfigManager:
         Returns:
             bool: Success or failure
         """
-        # Refresh config to ensure we have the latest state
-        self._refresh_config()
-
-        # Ensure stashed_servers section exists
-        if "stashed_servers" not in self._config:
-            self._config["stashed_servers"] = {}
-
-        # Ensure client section exists
-        if scope_name not in self._config["stashed_servers"]:
-            self._config["stashed_servers"][scope_name] = {}
-
         # Convert ServerConfig to dict if needed
         try:
             # If it's a ServerConfig object with to_dict method
@@ -144,7 +141,7 @@ class ClientConfigManager:
                 server_dict = server_config
 
             # Add the server configuration
-            stashed_servers = self._config.get("stashed_servers", {})
+            stashed_servers = self._get_stashed_servers() or {}
             if scope_name not in stashed_servers:
                 stashed_servers[scope_name] = {}
             stashed_servers[scope_name][server_name] = server_dict
@@ -167,11 +164,8 @@ class ClientConfigManager:
         Returns:
             Dict: Server configuration or None if not found
         """
-        # Refresh config to ensure we have the latest state
-        self._refresh_config()
-
         # Check if stashed_servers section exists
-        stashed_servers = self._config.get("stashed_servers", {})
+        stashed_servers = self._get_stashed_servers()
         if not stashed_servers:
             return None
 
@@ -216,11 +210,8 @@ class ClientConfigManager:
         Returns:
             bool: True if server is stashed, False otherwise
         """
-        # Refresh config to ensure we have the latest state
-        self._refresh_config()
-
         # Check if stashed_servers section exists
-        stashed_servers = self._config.get("stashed_servers", {})
+        stashed_servers = self._get_stashed_servers()
         if not stashed_servers:
             return False
 
@@ -240,11 +231,8 @@ class ClientConfigManager:
         Returns:
             Dict: Dictionary of server configurations by name
         """
-        # Refresh config to ensure we have the latest state
-        self._refresh_config()
-
         # Check if stashed_servers section exists
-        stashed_servers = self._config.get("stashed_servers", {})
+        stashed_servers = self._get_stashed_servers()
         if not stashed_servers:
             return {}
 
@@ -3,21 +3,13 @@ Client registry for MCPM
 Provides a central registry of MCP client managers
 """
 
+import importlib
 import logging
-from typing import Dict, List, Optional
+import os
+from typing import Dict, List, Optional, Tuple
 
-from mcpm.clients.base import BaseClientManager
+from mcpm.clients.base import BaseClientManager, JSONClientManager, YAMLClientManager
 from mcpm.clients.client_config import ClientConfigManager
-
-# Import all client managers
-from mcpm.clients.managers.claude_desktop import ClaudeDesktopManager
-from mcpm.clients.managers.cline import ClineManager, RooCodeManager
-from mcpm.clients.managers.continue_extension import ContinueManager
-from mcpm.clients.managers.cursor import CursorManager
-from mcpm.clients.managers.fiveire import FiveireManager
-from mcpm.clients.managers.goose import GooseClientManager
-from mcpm.clients.managers.trae import TraeManager
-from mcpm.clients.managers.windsurf import WindsurfManager
 from mcpm.utils.config import ConfigManager
 from mcpm.utils.scope import CLIENT_PREFIX, PROFILE_PREFIX
 
@@ -33,31 +25,55 @@ class ClientRegistry:
     # Client configuration manager for system-wide client settings
     _client_config_manager = ClientConfigManager()
 
-    # Dictionary mapping client keys to manager instances
-    _CLIENT_MANAGERS = {
-        "claude-desktop": ClaudeDesktopManager(),
-        "windsurf": WindsurfManager(),
-        "cursor": CursorManager(),
-        "cline": ClineManager(),
-        "continue": ContinueManager(),
-        "goose-cli": GooseClientManager(),
-        "5ire": FiveireManager(),
-        "roo-code": RooCodeManager(),
-        "trae": TraeManager(),
+    # Cached result of detect_installed_clients, populated on first call
+    _detection_cache: Optional[Dict[str, bool]] = None
+
+    # Dictionary mapping client keys to the module and class of their manager;
+    # instances are created lazily so only the clients actually used in a
+    # session pay the import and construction cost
+    _CLIENT_MANAGER_CLASSES = {
+        "claude-desktop": ("mcpm.clients.managers.claude_desktop", "ClaudeDesktopManager"),
+        "windsurf": ("mcpm.clients.managers.windsurf", "WindsurfManager"),
+        "cursor": ("mcpm.clients.managers.cursor", "CursorManager"),
+        "cline": ("mcpm.clients.managers.cline", "ClineManager"),
+        "continue": ("mcpm.clients.managers.continue_extension", "ContinueManager"),
+        "goose-cli": ("mcpm.clients.managers.goose", "GooseClientManager"),
+        "5ire": ("mcpm.clients.managers.fiveire", "FiveireManager"),
+        "roo-code": ("mcpm.clients.managers.cline", "RooCodeManager"),
+        "trae": ("mcpm.clients.managers.trae", "TraeManager"),
     }
 
+    # Frozen set of supported client names for O(1) membership checks
+    # without rebuilding a list per call
+    _SUPPORTED_CLIENTS = frozenset(_CLIENT_MANAGER_CLASSES)
+
+    # Cache of instantiated client managers, populated on first access
+    _manager_instances: Dict[str, BaseClientManager] = {}
+
     @classmethod
     def get_client_manager(cls, client_name: str) -> Optional[BaseClientManager]:
         """
         Get the client manager for a given client name
 
+        The manager is imported and instantiated on first access, then cached
+        for the lifetime of the process.
+
         Args:
             client_name: Name of the client
 
         Returns:
             BaseClientManager: Client manager instance or None if not found
         """
-        return cls._CLIENT_MANAGERS.get(client_name)
+        manager = cls._manager_instances.get(client_name)
+        if manager is None:
+            entry = cls._CLIENT_MANAGER_CLASSES.get(client_name)
+            if entry is None:
+                return None
+            module_name, class_name = entry
+            manager_class = getattr(importlib.import_module(module_name), class_name)
+            manager = manager_class()
+            cls._manager_instances[client_name] = manager
+        return manager
 
     @classmethod
     def get_all_client_managers(cls) -> Dict[str, BaseClientManager]:
@@ -67,17 +83,66 @@ class ClientRegistry:
         Returns:
             Dict[str, BaseClientManager]: Dictionary mapping client names to manager instances
         """
-        return cls._CLIENT_MANAGERS
+        return {client_name: cls.get_client_manager(client_name) for client_name in cls._CLIENT_MANAGER_CLASSES}
 
     @classmethod
     def detect_installed_clients(cls) -> Dict[str, bool]:
         """
         Detect which MCP-compatible clients are installed on the system
 
+        The result is cached for the lifetime of the process since installation
+        status rarely changes mid-command; call clear_detection_cache() to force
+        a rescan.
+
         Returns:
             Dict[str, bool]: Dictionary mapping client names to installed status
         """
-        return {client_name: manager.is_client_installed() for client_name, manager in cls._CLIENT_MANAGERS.items()}
+        if cls._detection_cache is None:
+            cls._detection_cache = cls._scan_installed_clients()
+        # Copy so callers mutating the result cannot poison the cache
+        return dict(cls._detection_cache)
+
+    @classmethod
+    def _scan_installed_clients(cls) -> Dict[str, bool]:
+        """Detect installed clients with one directory scan per parent dir
+
+        The default is_client_installed implementations just check that the
+        client's config directory exists, so grouping those directories by
+        parent and reading each parent's entries once replaces a stat call
+        per client with a single readdir per parent. Managers with a custom
+        is_client_installed are probed individually as before.
+        """
+        managers = cls.get_all_client_managers()
+        results: Dict[str, bool] = {}
+
+        # Group clients using the default directory-existence check by the
+        # parent of their config directory
+        default_checks = (JSONClientManager.is_client_installed, YAMLClientManager.is_client_installed)
+        by_parent: Dict[str, list[Tuple[str, str]]] = {}
+        for client_name, manager in managers.items():
+            if type(manager).is_client_installed in default_checks:
+                config_dir = os.path.dirname(manager.config_path)
+                by_parent.setdefault(os.path.dirname(config_dir), []).append((client_name, config_dir))
+            else:
+                results[client_name] = manager.is_client_installed()
+
+        for parent, entries in by_parent.items():
+            try:
+                with os.scandir(parent) as it:
+                    present = {entry.name for entry in it if entry.is_dir()}
+            except OSError:
+                # Parent missing or unreadable: none of its clients are installed
+                present = set()
+            for client_name, config_dir in entries:
+                results[client_name] = os.path.basename(config_dir) in present
+
+        # Preserve the registry's client ordering
+        return {client_name: results[client_name] for client_name in managers}
+
+    @classmethod
+    def clear_detection_cache(cls) -> None:
+        """Discard the cached installation status so the next detection rescans"""
+        cls._detection_cache = None
 
     @classmethod
     def get_client_info(cls, client_name: str) -> Dict[str, str]:
@@ -103,7 +168,7 @@ class ClientRegistry:
         Returns:
             Dict[str, Dict[str, str]]: Dictionary mapping client names to display information
         """
-        return {client_name: manager.get_client_info() for client_name, manager in cls._CLIENT_MANAGERS.items()}
+        return {client_name: manager.get_client_info() for client_name, manager in cls.get_all_client_managers().items()}
 
     @classmethod
     def get_active_client(cls) -> str | None:
@@ -147,6 +212,9 @@ class ClientRegistry:
         """
         Get the recommended client based on installation status
 
+        Shares the cached result of detect_installed_clients, so calling
+        both in one process performs a single filesystem scan.
+
         Returns:
             str: Name of the recommended client
         """
@@ -168,7 +236,20 @@ class ClientRegistry:
         Returns:
             List[str]: List of supported client names
         """
-        return list(cls._CLIENT_MANAGERS.keys())
+        return list(cls._CLIENT_MANAGER_CLASSES.keys())
+
+    @classmethod
+    def is_client_supported(cls, client_name: str) -> bool:
+        """
+        Check whether a client name is supported
+
+        Args:
+            client_name: Name of the client
+
+        Returns:
+            bool: True if the client is supported
+        """
+        return client_name in cls._SUPPORTED_CLIENTS
 
     @classmethod
     def get_active_profile(cls) -> str | None:
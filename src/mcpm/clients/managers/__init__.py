@@ -2,16 +2,24 @@
 Client manager implementations for various MCP clients
 
 This package contains specific implementations of client managers for MCP clients.
+
+Manager classes are loaded lazily (PEP 562) so that importing this package does
+not pay the import cost of every client module when only one client is used.
 """
 
-from mcpm.clients.managers.claude_desktop import ClaudeDesktopManager
-from mcpm.clients.managers.cline import ClineManager
-from mcpm.clients.managers.continue_extension import ContinueManager
-from mcpm.clients.managers.cursor import CursorManager
-from mcpm.clients.managers.fiveire import FiveireManager
-from mcpm.clients.managers.goose import GooseClientManager
-from mcpm.clients.managers.trae import TraeManager
-from mcpm.clients.managers.windsurf import WindsurfManager
+import importlib
+
+# Mapping of exported manager class names to the submodules that define them
+_LAZY_IMPORTS = {
+    "ClaudeDesktopManager": "mcpm.clients.managers.claude_desktop",
+    "ClineManager": "mcpm.clients.managers.cline",
+    "ContinueManager": "mcpm.clients.managers.continue_extension",
+    "CursorManager": "mcpm.clients.managers.cursor",
+    "FiveireManager": "mcpm.clients.managers.fiveire",
+    "GooseClientManager": "mcpm.clients.managers.goose",
+    "TraeManager": "mcpm.clients.managers.trae",
+    "WindsurfManager": "mcpm.clients.managers.windsurf",
+}
 
 __all__ = [
     "ClaudeDesktopManager",
@@ -23,3 +31,19 @@ __all__ = [
     "GooseClientManager",
     "TraeManager",
 ]
+
+
+def __getattr__(name: str):
+    """Lazily import a manager class on first attribute access"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name)
+    manager_class = getattr(module, name)
+    # Cache on the package so subsequent lookups skip __getattr__
+    globals()[name] = manager_class
+    return manager_class
+
+
+def __dir__():
+    return sorted(set(__all__) | set(globals()))
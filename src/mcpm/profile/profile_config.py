@@ -5,88 +5,102 @@ from typing import Dict, Optional
 from pydantic import TypeAdapter
 
 from mcpm.schemas.server_config import ServerConfig
+from mcpm.utils.config import DEFAULT_CONFIG_DIR
 
-DEFAULT_PROFILE_PATH = os.path.expanduser("~/.config/mcpm/profiles.json")
+DEFAULT_PROFILE_PATH = os.path.join(DEFAULT_CONFIG_DIR, "profiles.json")
 
 
 class ProfileConfigManager:
     def __init__(self, profile_path: str = DEFAULT_PROFILE_PATH):
         self.profile_path = os.path.expanduser(profile_path)
-        self._profiles = self._load_profiles()
+        # Parsed lazily on first access; validating every stored ServerConfig
+        # up front makes construction cost grow with the size of profiles.json
+        self._profiles: Optional[Dict[str, dict[str, ServerConfig]]] = None
+
+    def _get_profiles(self) -> Dict[str, dict[str, ServerConfig]]:
+        """Get the in-memory profiles, loading them from disk on first access"""
+        if self._profiles is None:
+            self._profiles = self._load_profiles()
+        return self._profiles
 
-    def _load_profiles(self) -> Dict[str, list[ServerConfig]]:
+    def _load_profiles(self) -> Dict[str, dict[str, ServerConfig]]:
+        # Profiles are keyed by server name internally so lookups and updates
+        # are O(1) instead of scanning the server list; insertion order is
+        # preserved so the on-disk list format round-trips unchanged.
         if not os.path.exists(self.profile_path):
             return {}
         with open(self.profile_path, "r") as f:
             profiles = json.load(f) or {}
         return {
-            name: [TypeAdapter(ServerConfig).validate_python(config) for config in configs]
+            name: {
+                server_config.name: server_config
+                for server_config in (TypeAdapter(ServerConfig).validate_python(config) for config in configs)
+            }
             for name, configs in profiles.items()
         }
 
     def _save_profiles(self) -> None:
-        profile_info = {name: [config.model_dump() for config in configs] for name, configs in self._profiles.items()}
+        profile_info = {
+            name: [config.model_dump() for config in configs.values()]
+            for name, configs in self._get_profiles().items()
+        }
         with open(self.profile_path, "w") as f:
             json.dump(profile_info, f, indent=2)
 
     def new_profile(self, profile_name: str) -> bool:
-        if profile_name in self._profiles:
+        profiles = self._get_profiles()
+        if profile_name in profiles:
             return False
-        self._profiles[profile_name] = []
+        profiles[profile_name] = {}
         self._save_profiles()
         return True
 
     def get_profile(self, profile_name: str) -> Optional[list[ServerConfig]]:
-        return self._profiles.get(profile_name)
+        servers = self._get_profiles().get(profile_name)
+        if servers is None:
+            return None
+        return list(servers.values())
 
     def get_profile_server(self, profile_name: str, server_name: str) -> Optional[ServerConfig]:
-        if profile_name not in self._profiles:
+        servers = self._get_profiles().get(profile_name)
+        if servers is None:
             return None
-        for server_config in self._profiles[profile_name]:
-            if server_config.name == server_name:
-                return server_config
-        return None
+        return servers.get(server_name)
 
     def set_profile(self, profile_name: str, config: ServerConfig) -> bool:
-        if profile_name not in self._profiles:
-            self._profiles[profile_name] = []
-        for idx, server_config in enumerate(self._profiles[profile_name]):
-            if server_config.name == config.name:
-                self._profiles[profile_name][idx] = config
-                break
-        else:
-            self._profiles[profile_name].append(config)
+        self._get_profiles().setdefault(profile_name, {})[config.name] = config
         self._save_profiles()
         return True
 
     def delete_profile(self, profile_name: str) -> bool:
-        if profile_name in self._profiles:
-            del self._profiles[profile_name]
+        profiles = self._get_profiles()
+        if profile_name in profiles:
+            del profiles[profile_name]
             self._save_profiles()
             return True
         return False
 
     def list_profiles(self) -> dict[str, list[ServerConfig]]:
-        return self._profiles
+        return {name: list(configs.values()) for name, configs in self._get_profiles().items()}
 
     def rename_profile(self, old_name: str, new_name: str) -> bool:
-        if old_name not in self._profiles:
+        profiles = self._get_profiles()
+        if old_name not in profiles:
             return False
-        if new_name in self._profiles:
+        if new_name in profiles:
             return False
-        self._profiles[new_name] = self._profiles.pop(old_name)
+        profiles[new_name] = profiles.pop(old_name)
         self._save_profiles()
         return True
 
     def remove_server(self, profile_name: str, server_name: str) -> bool:
-        if profile_name not in self._profiles:
+        servers = self._get_profiles().get(profile_name)
+        if servers is None or server_name not in servers:
             return False
-        for idx, server_config in enumerate(self._profiles[profile_name]):
-            if server_config.name == server_name:
-                self._profiles[profile_name].pop(idx)
-                self._save_profiles()
-                return True
-        return False
+        del servers[server_name]
+        self._save_profiles()
+        return True
 
     def reload(self):
-        self._profiles = self._load_profiles()
+        # Drop the cache; the next access re-reads profiles.json
+        self._profiles = None
@@ -2,15 +2,56 @@
 Configuration utilities for MCPM
 """
 
+import contextlib
+import functools
+import hashlib
 import json
 import logging
 import os
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 logger = logging.getLogger(__name__)
 
+# Prefer orjson for config (de)serialization when available; it is
+# C-implemented and considerably faster than the stdlib json module
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+except ImportError:
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+@functools.lru_cache(maxsize=1)
+def _default_config_dir() -> str:
+    """Resolve the default config directory, honoring XDG_CONFIG_HOME
+
+    An existing legacy ~/.config/mcpm tree takes precedence over an XDG
+    location that has not been used yet, so users who set XDG_CONFIG_HOME
+    keep their current config instead of getting a silent reset.
+    """
+    legacy_dir = os.path.expanduser("~/.config/mcpm")
+    xdg_config_home = os.environ.get("XDG_CONFIG_HOME")
+    if xdg_config_home:
+        xdg_dir = os.path.join(xdg_config_home, "mcpm")
+        if xdg_dir != legacy_dir and os.path.isdir(legacy_dir) and not os.path.isdir(xdg_dir):
+            return legacy_dir
+        return xdg_dir
+    return legacy_dir
+
+
 # Default configuration paths
-DEFAULT_CONFIG_DIR = os.path.expanduser("~/.config/mcpm")
+DEFAULT_CONFIG_DIR = _default_config_dir()
 DEFAULT_CONFIG_FILE = os.path.join(DEFAULT_CONFIG_DIR, "config.json")
 # default router config
 DEFAULT_HOST = "localhost"
@@ -23,6 +64,15 @@ RESOURCE_TEMPLATE_SPLITOR = ":"
 PROMPT_SPLITOR = "_p_"
 DEFAULT_SHARE_ADDRESS = f"share.mcpm.sh:{DEFAULT_PORT}"
 
+# Directories already created in this process, so repeat ConfigManager
+# constructions skip the mkdir syscall entirely
+_ENSURED_DIRS: set = set()
+
+
+def _content_hash(data: bytes) -> bytes:
+    """Short digest of serialized config bytes, used to skip no-op saves"""
+    return hashlib.blake2b(data, digest_size=8).digest()
+
 
 class ConfigManager:
     """Manages MCP basic configuration
@@ -35,25 +85,51 @@ class ConfigManager:
         self.config_path = config_path
         self.config_dir = os.path.dirname(config_path)
         self._config = None
+        self._dirty = False
+        self._in_batch = False
+        self._last_saved_hash = None
         self._ensure_dirs()
         self._load_config()
 
     def _ensure_dirs(self) -> None:
-        """Ensure all configuration directories exist"""
-        os.makedirs(self.config_dir, exist_ok=True)
+        """Ensure all configuration directories exist
+
+        Tries a single mkdir first and only falls back to makedirs when the
+        parent is missing; directories already ensured in this process are
+        skipped without any syscall.
+        """
+        if self.config_dir in _ENSURED_DIRS:
+            return
+        try:
+            os.mkdir(self.config_dir)
+        except FileExistsError:
+            pass
+        except FileNotFoundError:
+            os.makedirs(self.config_dir, exist_ok=True)
+        _ENSURED_DIRS.add(self.config_dir)
 
     def _load_config(self) -> None:
-        """Load configuration from file or create default"""
-        if os.path.exists(self.config_path):
-            try:
-                with open(self.config_path, "r") as f:
-                    self._config = json.load(f)
-            except json.JSONDecodeError:
-                logger.error(f"Error parsing config file: {self.config_path}")
-                self._config = self._default_config()
-        else:
+        """Load configuration from file or create default
+
+        Opens the file directly and handles a missing file as the exception
+        path, avoiding a redundant existence check on every load.
+        """
+        try:
+            with open(self.config_path, "rb") as f:
+                data = f.read()
+            self._config = _loads(data)
+            self._last_saved_hash = _content_hash(data)
+        except FileNotFoundError:
+            # Defer writing the default config until the first mutation, so
+            # read-only sessions on a fresh install never touch the disk
             self._config = self._default_config()
-            self._save_config()
+            self._dirty = True
+        except json.JSONDecodeError:
+            logger.error(f"Error parsing config file: {self.config_path}")
+            self._config = self._default_config()
+        # One read-only view shared by every get_config call; it tracks the
+        # underlying dict, so it only needs rebuilding on reload
+        self._config_view = MappingProxyType(self._config)
 
     def _default_config(self) -> Dict[str, Any]:
         """Create default configuration"""
@@ -61,13 +137,60 @@ class ConfigManager:
         return {}
 
     def _save_config(self) -> None:
-        """Save current configuration to file"""
-        with open(self.config_path, "w") as f:
-            json.dump(self._config, f, indent=2)
+        """Save current configuration to file
+
+        Writes to a temporary file and renames it into place so a partial
+        write can never corrupt the config. Saves whose serialized content
+        matches what is already on disk are skipped entirely.
+        """
+        data = _dumps(self._config)
+        content_hash = _content_hash(data)
+        if content_hash == self._last_saved_hash:
+            self._dirty = False
+            return
+        tmp_path = f"{self.config_path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+        except FileNotFoundError:
+            # The config dir vanished after it was first ensured; evict it
+            # from the cache, re-create it, and retry the write once
+            _ENSURED_DIRS.discard(self.config_dir)
+            self._ensure_dirs()
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+        os.replace(tmp_path, self.config_path)
+        self._last_saved_hash = content_hash
+        self._dirty = False
+
+    def _mark_dirty(self) -> None:
+        """Record a pending mutation, saving immediately unless batching"""
+        self._dirty = True
+        if not self._in_batch:
+            self._save_config()
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Batch multiple mutations into a single save
+
+        Mutations made inside the context are written out once on exit
+        instead of rewriting the config file per call.
+        """
+        self._in_batch = True
+        try:
+            yield self
+        finally:
+            self._in_batch = False
+            if self._dirty:
+                self._save_config()
+
+    def get_config(self) -> Mapping[str, Any]:
+        """Get the complete configuration
 
-    def get_config(self) -> Dict[str, Any]:
-        """Get the complete configuration"""
-        return self._config
+        Returns a read-only view of the internal dict; mutations must go
+        through set_config so they are persisted to disk.
+        """
+        return self._config_view
 
     def set_config(self, key: str, value: Any) -> bool:
         """Set a configuration value and persist to file
@@ -87,8 +210,8 @@ class ConfigManager:
                 # Set the key to the provided value
                 self._config[key] = value
 
-            # Save the updated configuration
-            self._save_config()
+            # Save the updated configuration (deferred inside batch())
+            self._mark_dirty()
             return True
         except Exception as e:
             logger.error(f"Error setting configuration {key}: {str(e)}")
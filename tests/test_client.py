@@ -282,3 +282,31 @@ def test_main_client_command_help():
     assert "ls" in result.output
     assert "set" in result.output
     assert "edit" in result.output
+
+
+def test_detect_installed_clients_cache(monkeypatch):
+    """Test that detection is cached, copy-safe, and invalidated on clear"""
+    scan_result = {"claude-desktop": True, "windsurf": False}
+    mock_scan = Mock(return_value=scan_result)
+    monkeypatch.setattr(ClientRegistry, "_scan_installed_clients", mock_scan)
+
+    # Start from a clean cache and restore it afterwards
+    ClientRegistry.clear_detection_cache()
+    try:
+        first = ClientRegistry.detect_installed_clients()
+        second = ClientRegistry.detect_installed_clients()
+        assert first == scan_result
+        assert second == scan_result
+        # Only one scan despite two calls
+        assert mock_scan.call_count == 1
+
+        # Mutating a returned dict must not poison the cache
+        first["claude-desktop"] = False
+        assert ClientRegistry.detect_installed_clients() == scan_result
+
+        # Clearing the cache forces a rescan
+        ClientRegistry.clear_detection_cache()
+        ClientRegistry.detect_installed_clients()
+        assert mock_scan.call_count == 2
+    finally:
+        ClientRegistry.clear_detection_cache()
@@ -0,0 +1,107 @@
+"""
+Tests for ConfigManager persistence behavior
+"""
+
+import json
+import os
+
+from mcpm.utils import config as config_module
+from mcpm.utils.config import ConfigManager
+
+
+def _write_count(monkeypatch):
+    """Patch os.replace in the config module to count config writes"""
+    calls = []
+    real_replace = os.replace
+
+    def counting_replace(src, dst):
+        calls.append(dst)
+        return real_replace(src, dst)
+
+    monkeypatch.setattr(config_module.os, "replace", counting_replace)
+    return calls
+
+
+def test_missing_file_defers_write(tmp_path):
+    """A missing config file is not written until the first mutation"""
+    config_path = str(tmp_path / "config.json")
+    config_manager = ConfigManager(config_path=config_path)
+
+    # Read-only session: nothing written yet
+    assert config_manager.get_config() == {}
+    assert not os.path.exists(config_path)
+
+    # First mutation performs the write
+    assert config_manager.set_config("active_client", "windsurf")
+    assert os.path.exists(config_path)
+    assert json.loads(open(config_path).read()) == {"active_client": "windsurf"}
+
+
+def test_noop_set_config_skips_rewrite(tmp_path, monkeypatch):
+    """Setting a key to its current value does not rewrite the file"""
+    config_path = str(tmp_path / "config.json")
+    config_manager = ConfigManager(config_path=config_path)
+    config_manager.set_config("active_client", "windsurf")
+
+    writes = _write_count(monkeypatch)
+    assert config_manager.set_config("active_client", "windsurf")
+    assert writes == []
+
+    # A fresh manager seeds its hash from the bytes on disk
+    reloaded = ConfigManager(config_path=config_path)
+    assert reloaded.set_config("active_client", "windsurf")
+    assert writes == []
+
+    # A real change still writes
+    assert config_manager.set_config("active_client", "cursor")
+    assert len(writes) == 1
+
+
+def test_batch_coalesces_writes(tmp_path, monkeypatch):
+    """Mutations inside batch() are flushed in a single write"""
+    config_path = str(tmp_path / "config.json")
+    config_manager = ConfigManager(config_path=config_path)
+
+    writes = _write_count(monkeypatch)
+    with config_manager.batch():
+        config_manager.set_config("active_client", "windsurf")
+        config_manager.set_config("active_profile", "work")
+        config_manager.set_config("router", {"host": "localhost"})
+        # Nothing flushed while batching
+        assert writes == []
+
+    assert len(writes) == 1
+    assert json.loads(open(config_path).read()) == {
+        "active_client": "windsurf",
+        "active_profile": "work",
+        "router": {"host": "localhost"},
+    }
+
+
+def test_corrupt_file_recovery(tmp_path):
+    """A corrupt config file falls back to the default config"""
+    config_path = str(tmp_path / "config.json")
+    with open(config_path, "w") as f:
+        f.write("{not valid json")
+
+    config_manager = ConfigManager(config_path=config_path)
+    assert config_manager.get_config() == {}
+
+    # Mutations still persist after recovery
+    assert config_manager.set_config("active_client", "windsurf")
+    assert json.loads(open(config_path).read()) == {"active_client": "windsurf"}
+
+
+def test_save_recreates_deleted_config_dir(tmp_path):
+    """Saving self-heals when the config dir disappears after first ensure"""
+    import shutil
+
+    config_dir = tmp_path / "mcpm"
+    config_path = str(config_dir / "config.json")
+    config_manager = ConfigManager(config_path=config_path)
+    config_manager.set_config("active_client", "windsurf")
+
+    # Simulate external cleanup; the dir stays in the ensured-dirs cache
+    shutil.rmtree(config_dir)
+    assert config_manager.set_config("active_client", "cursor")
+    assert json.loads(open(config_path).read()) == {"active_client": "cursor"}